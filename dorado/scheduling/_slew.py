@@ -6,7 +6,6 @@
 # SPDX-License-Identifier: NASA-1.3
 #
 from astropy.coordinates import Angle
-from astropy.coordinates.matrix_utilities import rotation_matrix
 from astropy import units as u
 import numpy as np
 
@@ -38,8 +37,23 @@ def slew_time(x, v, a):
     return np.where(x <= xc, np.sqrt(4 * x / a), (x + xc) / v)
 
 
-def matrix_trace(matrix):
-    return np.trace(matrix, axis1=-2, axis2=-1)
+def _slew_separation(lon1, lat1, lon2, lat2, roll):
+    """Smallest slew angle between two attitudes, without units.
+
+    This is the rotation angle of the composite rotation
+    Rx(roll) Ry(-lat1) Rz(lon1 - lon2) Ry(lat2), evaluated in closed form from
+    the scalar part of its quaternion so that no rotation matrices or
+    quantities are built. All arguments and the return value are in radians;
+    ``roll`` is the difference in roll angles.
+
+    """
+    c1, s1 = np.cos(0.5 * roll), -np.sin(0.5 * roll)
+    c2, s2 = np.cos(0.5 * lat1), np.sin(0.5 * lat1)
+    c3, s3 = np.cos(0.5 * (lon1 - lon2)), -np.sin(0.5 * (lon1 - lon2))
+    c4, s4 = np.cos(0.5 * lat2), -np.sin(0.5 * lat2)
+    w = c1 * c2 * c3 * c4 + s1 * c2 * s3 * s4 - c1 * s2 * c3 * s4 - \
+        s1 * s2 * s3 * c4
+    return np.arccos(np.clip(2 * np.square(w) - 1, -1, 1))
 
 
 def slew_separation(center1, center2, roll1=0 * u.rad, roll2=0 * u.rad):
@@ -76,8 +90,7 @@ def slew_separation(center1, center2, roll1=0 * u.rad, roll2=0 * u.rad):
     assert center1.is_equivalent_frame(center2)
     center1 = center1.spherical
     center2 = center2.spherical
-    mat = (rotation_matrix(roll2 - roll1, 'x') @
-           rotation_matrix(-center1.lat, 'y') @
-           rotation_matrix(center1.lon - center2.lon, 'z') @
-           rotation_matrix(center2.lat, 'y'))
-    return Angle(np.arccos(0.5 * (matrix_trace(mat) - 1)) * u.rad).to(u.deg)
+    return Angle(_slew_separation(
+        center1.lon.to_value(u.rad), center1.lat.to_value(u.rad),
+        center2.lon.to_value(u.rad), center2.lat.to_value(u.rad),
+        (roll2 - roll1).to_value(u.rad)) * u.rad).to(u.deg)
@@ -25,8 +25,13 @@ __all__ = ('Mission', 'dorado', 'ultrasat', 'uvex')
 
 
 def _read_orbit(filename):
-    with resources.path(data, filename) as p:
-        return TLE(p)
+    # FIXME: Remove the open_binary fallback once we require Python >= 3.9.
+    if hasattr(resources, 'files'):
+        f = resources.files(data).joinpath(filename).open('rb')
+    else:
+        f = resources.open_binary(data, filename)
+    with f:
+        return TLE(f)
 
 
 @dataclass
@@ -51,36 +56,71 @@ class Mission:
     max_angular_acceleration: u.Quantity
     """Maximum angular acceleration for slews."""
 
+    def __post_init__(self):
+        # Plain float copies of the slew parameters for unit-free arithmetic.
+        self._min_overhead_s = self.min_overhead.to_value(u.s)
+        self._max_angular_velocity_deg_s = self.max_angular_velocity.to_value(
+            u.deg / u.s)
+        self._max_angular_acceleration_deg_s2 = \
+            self.max_angular_acceleration.to_value(u.deg / u.s**2)
+
     def get_field_of_regard(self, *args, **kwargs):
         return get_field_of_regard(self.orbit, self.constraints,
                                    *args, **kwargs)
 
     def overhead(self, *args, **kwargs):
-        return np.maximum(self.min_overhead,
-                          slew_time(slew_separation(*args, **kwargs),
-                                    self.max_angular_velocity,
-                                    self.max_angular_acceleration))
-
-
-dorado = Mission(
-    constraints=(
-        TrappedParticleFluxConstraint(flux=1*u.cm**-2*u.s**-1,
-                                      energy=20*u.MeV,
-                                      particle='p', solar='max'),
-        TrappedParticleFluxConstraint(flux=100*u.cm**-2*u.s**-1,
-                                      energy=1*u.MeV,
-                                      particle='e', solar='max'),
-        BrightEarthLimbConstraint(28 * u.deg),
-        EarthLimbConstraint(6 * u.deg),
-        astroplan.SunSeparationConstraint(46 * u.deg),
-        astroplan.MoonSeparationConstraint(23 * u.deg),
-        astroplan.GalacticLatitudeConstraint(10 * u.deg)),
-    fov=FOV.from_rectangle(7.1 * u.deg),
-    orbit=_read_orbit('dorado-625km-sunsync.tle'),
-    min_overhead=0 * u.s,
-    max_angular_velocity=0.872 * u.deg / u.s,
-    max_angular_acceleration=0.244 * u.deg / u.s**2
-)
+        return self.overhead_seconds(
+            slew_separation(*args, **kwargs).to_value(u.deg)) * u.s
+
+    def overhead_seconds(self, separation):
+        """Calculate the overhead for slews through given separations.
+
+        Parameters
+        ----------
+        separation : float, numpy.ndarray
+            Slew distance in degrees.
+
+        Returns
+        -------
+        t : float, numpy.ndarray
+            Overhead in seconds.
+
+        Examples
+        --------
+        >>> from dorado.scheduling.mission import dorado
+        >>> dorado.overhead_seconds([1, 20])
+        array([ 4.04888165, 26.50955031])
+
+        """
+        return np.maximum(self._min_overhead_s,
+                          slew_time(np.asarray(separation),
+                                    self._max_angular_velocity_deg_s,
+                                    self._max_angular_acceleration_deg_s2))
+
+
+def _dorado():
+    return Mission(
+        constraints=(
+            TrappedParticleFluxConstraint(flux=1*u.cm**-2*u.s**-1,
+                                          energy=20*u.MeV,
+                                          particle='p', solar='max'),
+            TrappedParticleFluxConstraint(flux=100*u.cm**-2*u.s**-1,
+                                          energy=1*u.MeV,
+                                          particle='e', solar='max'),
+            BrightEarthLimbConstraint(28 * u.deg),
+            EarthLimbConstraint(6 * u.deg),
+            astroplan.SunSeparationConstraint(46 * u.deg),
+            astroplan.MoonSeparationConstraint(23 * u.deg),
+            astroplan.GalacticLatitudeConstraint(10 * u.deg)),
+        fov=FOV.from_rectangle(7.1 * u.deg),
+        orbit=_read_orbit('dorado-625km-sunsync.tle'),
+        min_overhead=0 * u.s,
+        max_angular_velocity=0.872 * u.deg / u.s,
+        max_angular_acceleration=0.244 * u.deg / u.s**2
+    )
+
+
+dorado: Mission
 """Configuration for Dorado.
 
 Notes
@@ -108,18 +148,22 @@ Notes
 """
 
 
-ultrasat = Mission(
-    constraints=(
-        EarthLimbConstraint(28 * u.deg),
-        astroplan.SunSeparationConstraint(46 * u.deg),
-        astroplan.MoonSeparationConstraint(23 * u.deg),
-        astroplan.GalacticLatitudeConstraint(10 * u.deg)),
-    fov=FOV.from_rectangle(14.1 * u.deg),
-    orbit=_read_orbit('goes17.tle'),
-    min_overhead=0 * u.s,
-    max_angular_velocity=0.872 * u.deg / u.s,
-    max_angular_acceleration=0.244 * u.deg / u.s**2
-)
+def _ultrasat():
+    return Mission(
+        constraints=(
+            EarthLimbConstraint(28 * u.deg),
+            astroplan.SunSeparationConstraint(46 * u.deg),
+            astroplan.MoonSeparationConstraint(23 * u.deg),
+            astroplan.GalacticLatitudeConstraint(10 * u.deg)),
+        fov=FOV.from_rectangle(14.1 * u.deg),
+        orbit=_read_orbit('goes17.tle'),
+        min_overhead=0 * u.s,
+        max_angular_velocity=0.872 * u.deg / u.s,
+        max_angular_acceleration=0.244 * u.deg / u.s**2
+    )
+
+
+ultrasat: Mission
 """Configuration for ULTRASAT.
 
 Notes
@@ -142,22 +186,26 @@ Notes
 """
 
 
-uvex = Mission(
-    constraints=(
-        EarthLimbConstraint(25 * u.deg),
-        astroplan.SunSeparationConstraint(46 * u.deg),
-        astroplan.MoonSeparationConstraint(25 * u.deg)
-    ),
-    fov=FOV.from_rectangle(3.3 * u.deg),
-    orbit=Spice(
-        'MGS SIMULATION',
-        'https://archive.stsci.edu/missions/tess/models/TESS_EPH_PRE_LONG_2021252_21.bsp',  # noqa: E501
-        'https://naif.jpl.nasa.gov/pub/naif/generic_kernels/pck/earth_latest_high_prec.bpc',  # noqa: E501
-        'https://naif.jpl.nasa.gov/pub/naif/generic_kernels/pck/pck00010.tpc'),  # noqa: E501
-    min_overhead=0 * u.s,
-    max_angular_velocity=0.872 * u.deg / u.s,
-    max_angular_acceleration=0.244 * u.deg / u.s**2
-)
+def _uvex():
+    return Mission(
+        constraints=(
+            EarthLimbConstraint(25 * u.deg),
+            astroplan.SunSeparationConstraint(46 * u.deg),
+            astroplan.MoonSeparationConstraint(25 * u.deg)
+        ),
+        fov=FOV.from_rectangle(3.3 * u.deg),
+        orbit=Spice(
+            'MGS SIMULATION',
+            'https://archive.stsci.edu/missions/tess/models/TESS_EPH_PRE_LONG_2021252_21.bsp',  # noqa: E501
+            'https://naif.jpl.nasa.gov/pub/naif/generic_kernels/pck/earth_latest_high_prec.bpc',  # noqa: E501
+            'https://naif.jpl.nasa.gov/pub/naif/generic_kernels/pck/pck00010.tpc'),  # noqa: E501
+        min_overhead=0 * u.s,
+        max_angular_velocity=0.872 * u.deg / u.s,
+        max_angular_acceleration=0.244 * u.deg / u.s**2
+    )
+
+
+uvex: Mission
 """Configuration for UVEX.
 
 Notes
@@ -178,3 +226,23 @@ Notes
 * Maximum angular acceleration, maximum angular velocity, and overhead time are
   assumed to be the same as for Dorado.
 """
+
+
+# The mission configurations are built on first access (PEP 562) so that
+# importing this module does not read orbit files or download SPICE kernels
+# for missions that are never used.
+_factories = {'dorado': _dorado, 'ultrasat': _ultrasat, 'uvex': _uvex}
+
+
+def __getattr__(name):
+    try:
+        factory = _factories[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+    value = globals()[name] = factory()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_factories))
@@ -43,15 +43,16 @@ def main(args=None):
     args = parser().parse_args(args)
 
     # Late imports
-    from astropy_healpix import HEALPix, nside_to_level, npix_to_nside
-    from astropy.coordinates import ICRS
+    from functools import lru_cache
+    import os
+    from astropy_healpix import HEALPix
+    from astropy.coordinates import ICRS, SkyCoord
     from astropy.time import Time
     from astropy.table import QTable
     from astropy import units as u
     from ligo.skymap.io import read_sky_map
     from ligo.skymap.bayestar import rasterize
     from ligo.skymap import plot
-    from ligo.skymap.postprocess import find_greedy_credible_levels
     from matplotlib import pyplot as plt
     from matplotlib.animation import FuncAnimation
     from matplotlib.ticker import FormatStrFormatter
@@ -66,22 +67,37 @@ def main(args=None):
     # Read multi-order sky map and rasterize to working resolution
     start_time = Time(args.start_time, format='isot')
     skymap = read_sky_map(args.skymap, moc=True)['UNIQ', 'PROBDENSITY']
-    skymap_hires = rasterize(skymap)['PROB']
-    healpix_hires = HEALPix(npix_to_nside(len(skymap_hires)))
-    skymap = rasterize(skymap,
-                       nside_to_level(healpix.nside))['PROB']
     nest = healpix.order == 'nested'
-    if nest:
-        skymap = skymap[healpix.ring_to_nested(np.arange(
-            len(skymap)))]
-        skymap_hires = skymap[healpix_hires.ring_to_nested(np.arange(
-            len(skymap_hires)))]
 
-    cls = find_greedy_credible_levels(skymap_hires)
+    # rasterize() returns NESTED ordering, so sky maps only need to be
+    # reordered if the model grid is RING. The permutation depends only on
+    # the resolution, so compute it once rather than once per sky map.
+    if not nest:
+        perm = healpix.ring_to_nested(np.arange(healpix.npix))
+
+    def rasterize_for_model(skymap):
+        """Rasterize a multi-order sky map to the model grid."""
+        # Single precision is plenty for probabilities that are only summed
+        # and displayed, and halves the memory traffic.
+        skymap = np.asarray(
+            rasterize(skymap, healpix.level)['PROB'], dtype=np.float32)
+        if not nest:
+            skymap = skymap[perm]
+        return skymap
+
+    skymap = rasterize_for_model(skymap)
 
     log.info('reading observing schedule')
     schedule = QTable.read(args.schedule.name, format='ascii.ecsv')
 
+    # Pull out plain columns once; per-row Table access is slow.
+    row_jd = schedule['time'].jd
+    row_survey = np.asarray(schedule['survey'])
+    row_center = schedule['center'].icrs
+    row_ra = row_center.ra.deg
+    row_dec = row_center.dec.deg
+    row_skymap = np.asarray(schedule['skymap'])
+
     times = schedule["time"]
 
     t = (times - times[0]).to(u.minute).value
@@ -94,45 +110,45 @@ def main(args=None):
     survey_set = list(set(schedule["survey"]))
     colors = seaborn.color_palette('Set2', n_colors=len(survey_set))
 
+    @lru_cache(maxsize=None)
+    def load_skymap(path, mtime):
+        """Read and rasterize a sky map, once per file path and mtime."""
+        return rasterize_for_model(
+            read_sky_map(path, moc=True)['UNIQ', 'PROBDENSITY'])
+
+    @lru_cache(maxsize=None)
+    def footprint_polygons(ra, dec):
+        """Get the footprint outline, split at the prime meridian, in deg."""
+        poly = mission.fov.footprint(SkyCoord(ra * u.deg, dec * u.deg)).icrs
+        vertices = np.column_stack((poly.ra.rad, poly.dec.rad))
+        return tuple(np.rad2deg(cut_vertices)
+                     for cut_vertices in plot.cut_prime_meridian(vertices))
+
+    @lru_cache(maxsize=None)
+    def footprint_healpix(ra, dec):
+        """Get the HEALPix indices of the footprint."""
+        return mission.fov.footprint_healpix(
+            healpix, SkyCoord(ra * u.deg, dec * u.deg))
+
+    # Keep only the cache key for each row's sky map rather than a copy of
+    # the map itself; the maps are looked up again when they are rendered.
     log.info('reading skymaps')
-    clss = []
-    skymaps = []
-    skymaps_hold = {}
-    clss_hold = {}
-    for ii, row in enumerate(schedule):
+    row_map_key = []
+    for ii, path in enumerate(row_skymap):
         if np.mod(ii, 100) == 0:
             print('%d/%d' % (ii, len(schedule)))
 
-        survey = row["survey"]
-        if (survey not in skymaps_hold) or (survey == "GW"):
-            skymap = read_sky_map(row['skymap'],
-                                  moc=True)['UNIQ', 'PROBDENSITY']
-            skymap_hires = rasterize(skymap)['PROB']
-            healpix_hires = HEALPix(npix_to_nside(len(skymap_hires)))
-            skymap = rasterize(skymap,
-                               nside_to_level(args.nside))
-            skymap = skymap['PROB']
-            nest = healpix.order == 'nested'
-            if not nest:
-                skymap = skymap[healpix.ring_to_nested(np.arange(
-                    len(skymap)))]
-                skymap_hires = skymap[healpix_hires.ring_to_nested(np.arange(
-                    len(skymap_hires)))]
-            cls = find_greedy_credible_levels(skymap_hires)
-            skymaps_hold[survey] = skymap
-            clss_hold[survey] = cls
-
-        clss.append(clss_hold[survey])
-        skymaps.append(skymaps_hold[survey])
-    schedule.add_column(clss, name='cls')
-    schedule.add_column(skymaps, name='map')
+        path = str(path)
+        key = (path, os.path.getmtime(path))
+        load_skymap(*key)
+        row_map_key.append(key)
 
     log.info('calculating field of regard')
     field_of_regard = mission.get_field_of_regard(
         healpix.healpix_to_skycoord(
             np.arange(healpix.npix)), times[::nslice], jobs=args.jobs)
 
-    orbit_field_of_regard = np.logical_or.reduce(field_of_regard)
+    orbit_field_of_regard = np.any(field_of_regard, axis=0)
     # continuous_viewing_zone = np.logical_and.reduce(field_of_regard)
 
     fig = plt.figure(figsize=(8, 8))
@@ -149,12 +165,13 @@ def main(args=None):
     twin.set_ylabel('Area ($10^4$ deg$^2$)')
     plt.setp(ax_time.get_xticklabels(), visible=False)
 
-    indices = np.asarray([], dtype=np.intp)
+    # Cumulative probability of the input sky map covered by the schedule.
+    seen = np.zeros(healpix.npix, dtype=bool)
     prob = []
-    for row in schedule:
-        new_indices = mission.fov.footprint_healpix(healpix, row['center'])
-        indices = np.unique(np.concatenate((indices, new_indices)))
-        prob.append(100 * skymap[indices].sum())
+    for ra, dec in zip(row_ra, row_dec):
+        new_indices = footprint_healpix(ra, dec)
+        seen[new_indices] = True
+        prob.append(100 * skymap[seen].sum())
 
     ax_prob = fig.add_subplot(gs_prob, sharex=ax_time, sharey=ax_time)
     start = (schedule['time'] - times[0]).to_value(u.minute).tolist()
@@ -164,12 +181,12 @@ def main(args=None):
     ax_prob.set_xlabel(f'Time since {start_time.iso} (minutes)')
     ax_prob.set_ylabel('Integrated prob.')
 
-    y = field_of_regard.sum(1) / healpix.npix * 100
+    y = np.count_nonzero(field_of_regard, axis=1) / healpix.npix * 100
     ax_time.fill_between(
         t[::nslice], y,
         np.repeat(100, len(y)), color=instantaneous_color, zorder=2.2)
 
-    y = orbit_field_of_regard.sum() / healpix.npix * 100
+    y = np.count_nonzero(orbit_field_of_regard) / healpix.npix * 100
     ax_time.axhspan(y, 100, color=orbit_color, zorder=2.3)
 
     ax_sky = fig.add_subplot(gs_sky, projection='astro hours mollweide')
@@ -198,28 +215,26 @@ def main(args=None):
             for artist in old_artists:
                 artist.remove()
             del old_artists[:]
-            for row in schedule:
-                if times[i] >= row['time']:
-                    poly = mission.fov.footprint(row['center']).icrs
-                    idx = survey_set.index(row['survey'])
-                    footprint_color = colors[idx]
-                    vertices = np.column_stack((poly.ra.rad, poly.dec.rad))
-                    for cut_vertices in plot.cut_prime_meridian(vertices):
-                        patch = plt.Polygon(
-                            np.rad2deg(cut_vertices),
-                            transform=ax_sky.get_transform('world'),
-                            facecolor=footprint_color,
-                            edgecolor=footprint_color,
-                            alpha=0.5)
-                        old_artists.append(ax_sky.add_patch(patch))
+            active = np.searchsorted(row_jd, time_jd[i], side='right')
+            for jj in range(active):
+                footprint_color = survey_to_color[row_survey[jj]]
+                for cut_vertices in footprint_polygons(row_ra[jj],
+                                                       row_dec[jj]):
+                    patch = plt.Polygon(
+                        cut_vertices,
+                        transform=ax_sky.get_transform('world'),
+                        facecolor=footprint_color,
+                        edgecolor=footprint_color,
+                        alpha=0.5)
+                    old_artists.append(ax_sky.add_patch(patch))
             old_artists.extend(ax_sky.contourf_hpx(
-                field_of_regard[i].astype(float), levels=[0, 0.5],
+                field_of_regard_f32[i], levels=[0, 0.5],
                 colors=[instantaneous_color], nested=nest,
                 zorder=0.2).collections)
 
-            if schedule[i]['survey'] in ['kilonova', 'galactic_plane', 'GW']:
-                old_artists.append(ax_sky.imshow_hpx((schedule[i]["map"],
-                                                     'ICRS'),
+            if row_survey[i] in ['kilonova', 'galactic_plane', 'GW']:
+                row_map = load_skymap(*row_map_key[i])
+                old_artists.append(ax_sky.imshow_hpx((row_map, 'ICRS'),
                                                      nested=nest,
                                                      cmap='cylon'))
 
@@ -230,6 +245,16 @@ def main(args=None):
         frames = [ii for ii in range(len(field_of_regard))]
         times = times[::nslice]
 
+        # Compare plain Julian dates rather than Time objects in the
+        # callback. The schedule is in time order, so the observations that
+        # have started by a given frame are a prefix of the table.
+        time_jd = times.jd
+
+        # Cast the field of regard for contouring once, not once per frame.
+        field_of_regard_f32 = field_of_regard.astype(np.float32)
+
+        survey_to_color = dict(zip(survey_set, colors))
+
         ani = FuncAnimation(fig, animate, frames=frames)
         # ani.save(args.output.name, writer=PillowWriter())
         ani.save(args.output.name, fps=30, extra_args=['-vcodec', 'libx264'])
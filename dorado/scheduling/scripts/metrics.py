@@ -50,6 +50,7 @@ def main(args=None):
     from ligo.skymap import plot
     import matplotlib
     from matplotlib import pyplot as plt
+    from matplotlib.collections import PolyCollection
     from matplotlib.pyplot import cm
     import numpy as np
     import seaborn
@@ -64,9 +65,6 @@ def main(args=None):
 
     log.info('reading observing schedule')
     schedule = Table.read(args.schedule.name, format='ascii.ecsv')
-    for col in schedule.colnames:
-        schedule[col].info.indices = []
-    schedule.add_index('time')
 
     idx, _, _ = schedule["center"].match_to_catalog_sky(centers)
     survey_set = list(set(schedule["survey"]))
@@ -75,42 +73,43 @@ def main(args=None):
     linestyles = ['-', '--', '-.', ':']
 
     log.info('splitting schedule')
+    tjd = schedule['time'].jd
+    surveys = np.asarray(schedule['survey'])
+    filters = np.asarray(schedule['filter'])
+
+    # Sort by center, then by time, so that consecutive observations of the
+    # same center are adjacent and the gaps between them are a single diff.
+    order = np.lexsort((tjd, idx))
+
+    # Number of exposures of each center, by survey and filter. Along the
+    # second axis, 0 is all surveys combined and ss + 1 is survey_set[ss].
     dts = {}
-    exposures = {}
-    for survey in survey_set:
+    exposures = np.zeros(
+        (len(centers), len(survey_set) + 1, len(filter_set)), dtype=np.int32)
+    for jj, filt in enumerate(filter_set):
+        exposures[:, 0, jj] = np.bincount(
+            idx[filters == filt], minlength=len(centers))
+    for ss, survey in enumerate(survey_set):
         dts[survey] = {}
-        exposures[survey] = {}
-        for filt in filter_set:
-            dts[survey][filt] = []
-            exposures[survey][filt] = np.zeros((len(centers), 1))
-    exposures['all'] = {}
-    for filt in filter_set:
-        exposures['all'][filt] = np.zeros((len(centers), 1))
-    for cc, cent in enumerate(centers):
-        if np.mod(cc, 100) == 0:
-            print('%d/%d' % (cc, len(centers)))
-
-        idy = np.where(idx == cc)[0]
-        if len(idy) == 0:
-            continue
-        exps = schedule.iloc[idy]
-        for filt in filter_set:
-            idf = np.where(exps["filter"] == filt)[0]
-            if len(idf) == 0:
-                continue
-            expsslice = exps.iloc[idf]
-            exposures['all'][filt][cc] = len(expsslice)
-            for ss, survey in enumerate(survey_set):
-                idz = np.where(expsslice["survey"] == survey)[0]
-                if len(idz) == 0:
-                    continue
-                exposures[survey][filt][cc] = len(idz)
-                for ii in range(len(idz)-1):
-                    jj, kk = idz[ii], idz[ii+1]
-                    dt = expsslice[kk]["time"] - expsslice[jj]["time"]
-                    if np.isclose(dt.jd, 0.0):
-                        continue
-                    dts[survey][filt].append(dt.jd)
+        for jj, filt in enumerate(filter_set):
+            mask = (surveys == survey) & (filters == filt)
+            exposures[:, ss + 1, jj] = np.bincount(
+                idx[mask], minlength=len(centers))
+            sel = order[mask[order]]
+            dt = np.diff(tjd[sel])
+            keep = (np.diff(idx[sel]) == 0) & ~np.isclose(dt, 0.0)
+            dts[survey][filt] = dt[keep]
+
+    # Evaluate all tile footprints in one call and split them at the prime
+    # meridian once; the outlines are reused for every survey and filter.
+    polys = mission.fov.footprint(centers).icrs
+    all_cut_vertices = []
+    n_cuts = []
+    for ra, dec in zip(polys.ra.rad, polys.dec.rad):
+        cut_polys = plot.cut_prime_meridian(np.column_stack((ra, dec)))
+        all_cut_vertices.extend(np.rad2deg(cut_vertices)
+                                for cut_vertices in cut_polys)
+        n_cuts.append(len(cut_polys))
 
     log.info('plotting metrics')
 
@@ -132,27 +131,30 @@ def main(args=None):
 
     colors = cm.rainbow(np.linspace(0, 1, 10))
 
-    for survey in survey_set + ["all"]:
+    for ss, survey in enumerate(["all"] + survey_set):
         for jj, filt in enumerate(filter_set):
+            counts = exposures[:, ss, jj]
             fig = plt.figure(figsize=(12, 6))
             ax = plt.axes([0.05, 0.05, 0.85, 0.9],
                           projection='astro hours mollweide')
             ax.grid()
-            vmin, vmax = 0, np.max(exposures[survey][filt])
-            colorbar = np.linspace(vmin, vmax, len(colors))
+            vmin, vmax = 0, np.max(counts)
             norm = matplotlib.colors.Normalize(vmin=vmin, vmax=vmax)
-            for cc, center in enumerate(centers):
-                poly = mission.fov.footprint(center).icrs
-                idx = np.argmin(np.abs(colorbar - exposures[survey][filt][cc]))
-                footprint_color = colors[idx]
-                vertices = np.column_stack((poly.ra.rad, poly.dec.rad))
-                for cut_vertices in plot.cut_prime_meridian(vertices):
-                    patch = plt.Polygon(np.rad2deg(cut_vertices),
-                                        transform=ax.get_transform('world'),
-                                        facecolor=footprint_color,
-                                        edgecolor=footprint_color,
-                                        alpha=0.5)
-                    ax.add_patch(patch)
+            # The color levels are evenly spaced from vmin to vmax, so the
+            # nearest level to each tile's count is found by rounding, with
+            # ties going to the lower level.
+            step = (vmax - vmin) / (len(colors) - 1)
+            if step > 0:
+                color_idx = np.clip(
+                    np.ceil((counts - vmin) / step - 0.5),
+                    0, len(colors) - 1).astype(int)
+            else:
+                color_idx = np.zeros(len(centers), dtype=int)
+            footprint_colors = np.repeat(colors[color_idx], n_cuts, axis=0)
+            ax.add_collection(PolyCollection(
+                all_cut_vertices, transform=ax.get_transform('world'),
+                facecolors=footprint_colors, edgecolors=footprint_colors,
+                alpha=0.5))
             cax = ax.inset_axes([0.97, 0.2, 0.05, 0.6], transform=ax.transAxes)
             cbar = fig.colorbar(cm.ScalarMappable(norm=norm, cmap=cm.rainbow),
                                 cax=cax)
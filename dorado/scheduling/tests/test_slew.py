@@ -0,0 +1,33 @@
+#
+# Copyright © 2021 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# SPDX-License-Identifier: NASA-1.3
+#
+from astropy.coordinates import SkyCoord
+from astropy.coordinates.matrix_utilities import rotation_matrix
+from astropy import units as u
+from hypothesis import given, settings
+from hypothesis.strategies import floats
+import numpy as np
+
+from .._slew import slew_separation
+
+
+@given(floats(0, 360), floats(-90, 90), floats(0, 360), floats(-90, 90),
+       floats(-180, 180), floats(-180, 180))
+@settings(deadline=None)
+def test_slew_separation(lon1, lat1, lon2, lat2, roll1, roll2):
+    """Test slew_separation against the explicit rotation matrix product."""
+    lon1, lat1, lon2, lat2, roll1, roll2 = (
+        _ * u.deg for _ in (lon1, lat1, lon2, lat2, roll1, roll2))
+    mat = (rotation_matrix(roll2 - roll1, 'x') @
+           rotation_matrix(-lat1, 'y') @
+           rotation_matrix(lon1 - lon2, 'z') @
+           rotation_matrix(lat2, 'y'))
+    expected = np.arccos(np.clip(0.5 * (np.trace(mat) - 1), -1, 1)) * u.rad
+
+    result = slew_separation(SkyCoord(lon1, lat1), SkyCoord(lon2, lat2),
+                             roll1, roll2)
+    assert u.isclose(result, expected, atol=1e-5 * u.deg)